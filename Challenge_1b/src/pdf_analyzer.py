@@ -49,7 +49,7 @@ class PDFAnalyzer:
         for filename, doc_data in pdf_data.items():
             sections = doc_data.get('sections', [])
             for section in sections:
-                section['document'] = filename
+                section.document = filename
                 all_sections.append(section)
         
         # Rank sections by importance
@@ -61,10 +61,10 @@ class PDFAnalyzer:
         for i, (section, score) in enumerate(ranked_sections[:5]):
             self.json_handler.add_extracted_section(
                 output_data,
-                section['document'],
-                section['title'],
+                section.document,
+                section.title,
                 i + 1,  # importance_rank (1-5)
-                section['page_number']
+                section.page_number
             )
         
         # Generate subsection analysis
@@ -101,12 +101,11 @@ class PDFAnalyzer:
                 })
         
         # Rank pages by relevance
-        ranked_pages = []
-        for page_info in all_pages:
-            relevance_score, _ = self.persona_analyzer.analyze_content_relevance(
-                page_info['text'], persona_type, task_description
-            )
-            ranked_pages.append((page_info, relevance_score))
+        task_terms = self.persona_analyzer.get_task_terms(task_description)
+        scores = self.persona_analyzer.score_texts(
+            [page_info['text'] for page_info in all_pages], persona_type, task_terms
+        )
+        ranked_pages = list(zip(all_pages, scores))
         
         # Sort by relevance score
         ranked_pages.sort(key=lambda x: x[1], reverse=True)
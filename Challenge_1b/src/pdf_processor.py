@@ -1,22 +1,200 @@
+import fitz
 import pdfplumber
-import PyPDF2
+import hashlib
 import os
+import pickle
+import re
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
 
+# PyMuPDF's plain-text flags without ligature preservation, so "ﬁ" comes
+# out as "fi" as it did from pdfplumber and keyword matching still sees it
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+# The space PyMuPDF leaves at the end of every line
+_TRAILING_SPACE_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+# Headings that open back matter, for use as stop_on_heading
+BACK_MATTER_HEADINGS = ('references', 'bibliography', 'appendix', 'index')
+
+# Parsed PDFs are cached here across runs, keyed by a content fingerprint
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdfproc')
+# Bump whenever extraction or the cached result layout changes
+_CACHE_VERSION = 4
+
+
+def _code_fingerprint() -> str:
+    """
+    Hash this module's source and the PyMuPDF and pdfplumber versions.
+    
+    Part of every cache key, so editing the extraction or sectioning code
+    or upgrading either parser invalidates old entries even if _CACHE_VERSION
+    is not bumped.
+    """
+    versions = f"{fitz.VersionBind} {pdfplumber.__version__}"
+    fingerprint = hashlib.sha1(versions.encode('utf-8'))
+    fingerprint.update(Path(__file__).read_bytes())
+    return fingerprint.hexdigest()
+
+
+_CODE_FINGERPRINT = _code_fingerprint()
+
+
+def _opens_with_heading(text: str, headings: Optional[Tuple[str, ...]]) -> bool:
+    """
+    Check whether a page's first non-empty line is one of the given headings.
+    
+    The heading must start the line and end at a word boundary, so
+    "Appendix B" and "References:" match but "Indexing" and a body line
+    such as "See the index for..." do not.
+    
+    Args:
+        text: Stripped page text
+        headings: Lowercase headings, or None
+        
+    Returns:
+        True if the page opens with one of the headings
+    """
+    if not headings:
+        return False
+    first_line = text.split('\n', 1)[0].strip().lower()
+    for heading in headings:
+        if first_line.startswith(heading) and (
+                len(first_line) == len(heading) or not first_line[len(heading)].isalnum()):
+            return True
+    return False
+
+
+@dataclass(slots=True)
+class Section:
+    """A header line and the text that follows it, up to the next header."""
+    title: str
+    content: str
+    start_line: int
+    page_number: int = -1
+    document: str = ''
+
+
 class PDFProcessor:
     """Handles PDF text extraction and document structure analysis."""
     
-    def __init__(self):
+    def __init__(self, skip_scanned: bool = True, cache_dir: Optional[str] = CACHE_DIR):
+        """
+        Args:
+            skip_scanned: Drop pages with (almost) no text layer, such as
+                scanned or image-only pages, before any further processing
+            cache_dir: Directory where process_pdf_collection caches parsed
+                PDFs between runs, or None to always parse
+        """
         self.supported_extensions = ['.pdf']
+        self.skip_scanned = skip_scanned
+        self.cache_dir = cache_dir
+        self.min_page_chars = 10
+        
+        # Section header cues, compiled once so each line is a single C-level scan
+        header_keywords = [
+            'guide', 'overview', 'introduction', 'summary',
+            'tips', 'tricks', 'instructions', 'steps', 'recipe',
+            'ingredients', 'method', 'procedure', 'workflow',
+            'feature', 'tool', 'function', 'destination', 'activity'
+        ]
+        self._header_keyword_re = re.compile('|'.join(header_keywords), re.IGNORECASE)
+        self._header_prefix_re = re.compile(r'Chapter|Section|Part')
+        # Word initials that rule out title case: anything but an ASCII capital,
+        # at the start of a word that is not one of the lowercase-able minor words
+        self._title_case_suspect_re = re.compile(
+            r'(?:^|(?<=\s))(?!(?ai:a|an|the|and|or|of|in|on|at|to|for)(?!\S))[^A-Z\s]'
+        )
     
-    def extract_text_from_pdf(self, pdf_path: str) -> Dict[int, str]:
+    def extract_text_from_pdf(self, pdf_path: str, max_pages: Optional[int] = None,
+                              stop_on_heading: Optional[Tuple[str, ...]] = None) -> Dict[int, str]:
         """
         Extract text from PDF file with page numbers.
         
         Args:
             pdf_path: Path to the PDF file
+            max_pages: Only read the first max_pages pages
+            stop_on_heading: Lowercase headings such as BACK_MATTER_HEADINGS;
+                reading stops at the first page whose first line is one of
+                them, and that page is left out
+            
+        Returns:
+            Dictionary with page numbers as keys and text content as values
+        """
+        try:
+            with fitz.open(pdf_path) as doc:
+                return self._extract_text_from_document(doc, max_pages, stop_on_heading)
+        except Exception as e:
+            print(f"PyMuPDF failed on {pdf_path}, falling back to pdfplumber: {str(e)}")
+            return self._extract_text_with_pdfplumber(pdf_path, max_pages, stop_on_heading)
+    
+    def extract_text_and_info(self, pdf_path: str, file_size: Optional[int] = None,
+                              max_pages: Optional[int] = None,
+                              stop_on_heading: Optional[Tuple[str, ...]] = None) -> Tuple[Dict[int, str], Dict]:
+        """
+        Extract page text and document information from one parse of the file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            file_size: Size of the file in bytes, if already known
+            max_pages: As for extract_text_from_pdf
+            stop_on_heading: As for extract_text_from_pdf
+            
+        Returns:
+            Tuple of (pages, document info) as returned by
+            extract_text_from_pdf and get_document_info
+        """
+        try:
+            with fitz.open(pdf_path) as doc:
+                pages = self._extract_text_from_document(doc, max_pages, stop_on_heading)
+                return pages, self._document_info(pdf_path, doc, file_size)
+        except Exception as e:
+            print(f"PyMuPDF failed on {pdf_path}, falling back to pdfplumber: {str(e)}")
+            pages = self._extract_text_with_pdfplumber(pdf_path, max_pages, stop_on_heading)
+            return pages, self.get_document_info(pdf_path, file_size)
+    
+    def _extract_text_from_document(self, doc: fitz.Document, max_pages: Optional[int] = None,
+                                    stop_on_heading: Optional[Tuple[str, ...]] = None) -> Dict[int, str]:
+        """
+        Extract text from an open PyMuPDF document.
+        
+        Args:
+            doc: Open PyMuPDF document
+            max_pages: As for extract_text_from_pdf
+            stop_on_heading: As for extract_text_from_pdf
+            
+        Returns:
+            Dictionary with page numbers as keys and text content as values
+        """
+        pages = {}
+        # islice stops before later pages are even loaded
+        for page_num, page in enumerate(islice(doc, max_pages), 1):
+            text = _TRAILING_SPACE_RE.sub('', page.get_text("text", flags=_TEXT_FLAGS)).strip()
+            # Scanned/image-only pages have no (or a token) text layer
+            if self.skip_scanned and len(text) < self.min_page_chars:
+                continue
+            if _opens_with_heading(text, stop_on_heading):
+                break
+            if text:
+                pages[page_num] = text
+        return pages
+    
+    def _extract_text_with_pdfplumber(self, pdf_path: str, max_pages: Optional[int] = None,
+                                      stop_on_heading: Optional[Tuple[str, ...]] = None) -> Dict[int, str]:
+        """
+        Extract text with pdfplumber's layout analysis.
+        
+        Much slower than PyMuPDF; only used when PyMuPDF cannot read the file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            max_pages: As for extract_text_from_pdf
+            stop_on_heading: As for extract_text_from_pdf
             
         Returns:
             Dictionary with page numbers as keys and text content as values
@@ -24,16 +202,22 @@ class PDFProcessor:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 pages = {}
-                for page_num, page in enumerate(pdf.pages, 1):
+                for page_num, page in enumerate(pdf.pages[:max_pages], 1):
+                    # Counting characters is far cheaper than layout analysis
+                    if self.skip_scanned and len(page.chars) < self.min_page_chars:
+                        continue
                     text = page.extract_text()
                     if text:
-                        pages[page_num] = text.strip()
+                        text = text.strip()
+                        if _opens_with_heading(text, stop_on_heading):
+                            break
+                        pages[page_num] = text
                 return pages
         except Exception as e:
             print(f"Error processing {pdf_path}: {str(e)}")
             return {}
     
-    def extract_sections_from_text(self, text: str) -> List[Dict]:
+    def extract_sections_from_text(self, text: str) -> List[Section]:
         """
         Identify sections in the text based on headers and structure.
         
@@ -41,32 +225,21 @@ class PDFProcessor:
             text: Text content from a page
             
         Returns:
-            List of dictionaries containing section information
+            List of sections, without page number or document set
         """
         sections = []
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line and self._is_section_header(line):
-                # Look for content after the header
-                content_start = i + 1
-                content_end = len(lines)
-                
-                # Find the next section header or end of content
-                for j in range(i + 1, len(lines)):
-                    if self._is_section_header(lines[j].strip()):
-                        content_end = j
-                        break
-                
-                # Extract content for this section
-                content = '\n'.join(lines[content_start:content_end]).strip()
-                
-                sections.append({
-                    'title': line,
-                    'content': content,
-                    'start_line': i
-                })
+        lines = text.splitlines()
+        stripped_lines = [line.strip() for line in lines]
+        
+        # Classify every line once; each section then runs from its header
+        # to the next header (or the end of the text)
+        headers = [i for i, line in enumerate(stripped_lines) if self._is_section_header(line)]
+        
+        for start, end in zip(headers, headers[1:] + [len(lines)]):
+            # Extract content for this section
+            content = '\n'.join(lines[start + 1:end]).strip()
+            
+            sections.append(Section(stripped_lines[start], content, start))
         
         return sections
     
@@ -75,75 +248,88 @@ class PDFProcessor:
         Determine if a line is likely a section header.
         
         Args:
-            line: Text line to analyze
+            line: Text line to analyze, already stripped
             
         Returns:
             True if line appears to be a section header
         """
-        if not line:
-            return False
-        
-        # Clean the line
-        line = line.strip()
         if len(line) < 3:
             return False
         
-        # Check for common header patterns
-        header_indicators = [
-            line.isupper() and len(line) > 3,  # All caps and meaningful length
-            line.startswith('Chapter'),
-            line.startswith('Section'),
-            line.startswith('Part'),
-            len(line.split()) <= 8 and len(line) > 10,  # Short but meaningful titles
-            any(keyword in line.lower() for keyword in [
-                'guide', 'overview', 'introduction', 'summary',
-                'tips', 'tricks', 'instructions', 'steps', 'recipe',
-                'ingredients', 'method', 'procedure', 'workflow',
-                'feature', 'tool', 'function', 'destination', 'activity'
-            ]),
-            # Check for title case patterns
-            (line[0].isupper() and line.count(' ') >= 1 and 
-             all(word[0].isupper() or word.lower() in ['a', 'an', 'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for'] 
-                 for word in line.split()))
-        ]
-        
-        return any(header_indicators)
+        # Check for common header patterns, cheapest first, stopping at the
+        # first one that matches
+        if line.isupper() and len(line) > 3:  # All caps and meaningful length
+            return True
+        if self._header_prefix_re.match(line):
+            return True
+        if len(line.split()) <= 8 and len(line) > 10:  # Short but meaningful titles
+            return True
+        if self._header_keyword_re.search(line):
+            return True
+        # Check for title case patterns; only non-ASCII initials found by the
+        # regex still need an isupper() check of their own
+        return (line[0].isupper() and ' ' in line and
+                all(m.group().isupper() for m in self._title_case_suspect_re.finditer(line)))
     
-    def get_document_info(self, pdf_path: str) -> Dict:
+    def get_document_info(self, pdf_path: str, file_size: Optional[int] = None) -> Dict:
         """
         Extract basic document information.
         
         Args:
             pdf_path: Path to the PDF file
+            file_size: Size of the file in bytes, if already known
             
         Returns:
             Dictionary with document metadata
         """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                info = {
-                    'num_pages': len(pdf_reader.pages),
-                    'filename': os.path.basename(pdf_path),
-                    'file_size': os.path.getsize(pdf_path)
-                }
-                
-                # Try to get document metadata
-                if pdf_reader.metadata:
-                    info['title'] = pdf_reader.metadata.get('/Title', '')
-                    info['author'] = pdf_reader.metadata.get('/Author', '')
-                
-                return info
+            with fitz.open(pdf_path) as doc:
+                return self._document_info(pdf_path, doc, file_size)
         except Exception as e:
             print(f"Error getting document info for {pdf_path}: {str(e)}")
             return {'filename': os.path.basename(pdf_path)}
     
-    def process_pdf_collection(self, collection_path: str) -> Dict[str, Dict]:
+    def _document_info(self, pdf_path: str, doc: fitz.Document,
+                       file_size: Optional[int] = None) -> Dict:
+        """
+        Read document information from an open PyMuPDF document.
+        
+        The page count and metadata come from the trailer and page tree, so
+        no page content is parsed.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            doc: The file opened with PyMuPDF
+            file_size: Size of the file in bytes; looked up when not given
+            
+        Returns:
+            Dictionary with document metadata
+        """
+        if file_size is None:
+            file_size = os.path.getsize(pdf_path)
+        info = {
+            'num_pages': doc.page_count,
+            'filename': os.path.basename(pdf_path),
+            'file_size': file_size
+        }
+        
+        # Try to get document metadata
+        metadata = doc.metadata
+        if metadata:
+            info['title'] = metadata.get('title', '')
+            info['author'] = metadata.get('author', '')
+        
+        return info
+    
+    def process_pdf_collection(self, collection_path: str, max_pages: Optional[int] = None,
+                               stop_on_heading: Optional[Tuple[str, ...]] = None) -> Dict[str, Dict]:
         """
         Process all PDFs in a collection directory.
         
         Args:
             collection_path: Path to collection directory
+            max_pages: As for extract_text_from_pdf
+            stop_on_heading: As for extract_text_from_pdf
             
         Returns:
             Dictionary with filename as key and processed content as value
@@ -155,23 +341,162 @@ class PDFProcessor:
             print(f"PDF directory not found: {pdf_dir}")
             return collection_data
         
-        for filename in os.listdir(pdf_dir):
-            if filename.lower().endswith('.pdf'):
-                pdf_path = os.path.join(pdf_dir, filename)
-                pages = self.extract_text_from_pdf(pdf_path)
-                doc_info = self.get_document_info(pdf_path)
-                
-                collection_data[filename] = {
-                    'pages': pages,
-                    'info': doc_info,
-                    'sections': []
+        # scandir's entries carry their stat results, so file sizes come
+        # without a second stat call per file
+        entries = []
+        with os.scandir(pdf_dir) as it:
+            for entry in it:
+                if not entry.name.lower().endswith('.pdf'):
+                    continue
+                # A broken link or a file removed mid-listing skips just that file
+                try:
+                    entries.append((entry.name, entry.path, entry.stat().st_size))
+                except OSError as e:
+                    print(f"Error processing {entry.path}: {str(e)}")
+        if not entries:
+            return collection_data
+        
+        # Unchanged PDFs come straight from the cache
+        results = {}
+        misses = []
+        for filename, pdf_path, file_size in entries:
+            cache_path = self._cache_path(pdf_path, file_size, max_pages, stop_on_heading)
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                results[filename] = cached
+            else:
+                misses.append((pdf_path, file_size, cache_path))
+        
+        # Each PDF is independent, so parse the rest in parallel worker processes
+        if misses:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(_process_one_pdf, self, pdf_path, file_size,
+                                    max_pages, stop_on_heading): cache_path
+                    for pdf_path, file_size, cache_path in misses
                 }
-                
-                # Extract sections from each page
-                for page_num, text in pages.items():
-                    sections = self.extract_sections_from_text(text)
-                    for section in sections:
-                        section['page_number'] = page_num
-                        collection_data[filename]['sections'].append(section)
-        
-        return collection_data 
\ No newline at end of file
+                for future in as_completed(futures):
+                    filename, pages, doc_info, sections = future.result()
+                    results[filename] = {
+                        'pages': pages,
+                        'info': doc_info,
+                        'sections': sections
+                    }
+                    self._store_cached(futures[future], results[filename])
+        
+        # Keep directory listing order so downstream ranking stays deterministic
+        for filename, _, _ in entries:
+            collection_data[filename] = results[filename]
+        
+        return collection_data
+    
+    def _cache_path(self, pdf_path: str, file_size: int, max_pages: Optional[int],
+                    stop_on_heading: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+        """
+        Locate the cache entry for a PDF.
+        
+        The key fingerprints the first 64KB of the file and its size (cheap
+        to read, and incremental PDF updates always grow the file), plus the
+        file name, every setting that affects the parsed result and the
+        extraction code itself (see _code_fingerprint).
+        
+        Args:
+            pdf_path: Path to the PDF file
+            file_size: Size of the file in bytes
+            max_pages: As for extract_text_from_pdf
+            stop_on_heading: As for extract_text_from_pdf
+            
+        Returns:
+            Path of the cache file, or None if caching is off or the PDF
+            cannot be read
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(pdf_path, 'rb', buffering=0) as file:
+                head = file.read(65536)
+        except OSError:
+            return None
+        
+        settings = (_CACHE_VERSION, _CODE_FINGERPRINT, os.path.basename(pdf_path),
+                    self.skip_scanned, self.min_page_chars, max_pages,
+                    tuple(stop_on_heading) if stop_on_heading else None)
+        fingerprint = hashlib.sha1(head)
+        fingerprint.update(struct.pack('<Q', file_size))
+        fingerprint.update(repr(settings).encode('utf-8'))
+        return os.path.join(self.cache_dir, f"{fingerprint.hexdigest()}.pkl")
+    
+    def _load_cached(self, cache_path: Optional[str]) -> Optional[Dict]:
+        """
+        Load a cached PDF result; a missing or unreadable entry is a miss.
+        
+        Args:
+            cache_path: Path from _cache_path
+            
+        Returns:
+            The cached result dictionary, or None
+        """
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'rb') as file:
+                return pickle.load(file)
+        except Exception:
+            return None
+    
+    def _store_cached(self, cache_path: Optional[str], result: Dict) -> None:
+        """
+        Save a PDF result to the cache. Best effort: failures are ignored.
+        
+        The entry is written to a temporary file and renamed into place, so
+        concurrent or interrupted runs never see a partial entry.
+        
+        Args:
+            cache_path: Path from _cache_path
+            result: Result dictionary for the PDF
+        """
+        if cache_path is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+def _process_one_pdf(processor: PDFProcessor, pdf_path: str, file_size: Optional[int] = None,
+                     max_pages: Optional[int] = None,
+                     stop_on_heading: Optional[Tuple[str, ...]] = None) -> Tuple[str, Dict[int, str], Dict, List[Section]]:
+    """
+    Extract pages, document info and sections for a single PDF.
+    
+    Module-level so it can be pickled and run in a worker process.
+    
+    Args:
+        processor: PDFProcessor whose settings to use
+        pdf_path: Path to the PDF file
+        file_size: Size of the file in bytes, if already known
+        max_pages: As for PDFProcessor.extract_text_from_pdf
+        stop_on_heading: As for PDFProcessor.extract_text_from_pdf
+        
+    Returns:
+        Tuple of (filename, pages, document info, sections)
+    """
+    pages, doc_info = processor.extract_text_and_info(pdf_path, file_size, max_pages, stop_on_heading)
+    
+    # Extract sections from each page
+    sections = []
+    for page_num, text in pages.items():
+        for section in processor.extract_sections_from_text(text):
+            section.page_number = page_num
+            sections.append(section)
+    
+    return os.path.basename(pdf_path), pages, doc_info, sections 
\ No newline at end of file
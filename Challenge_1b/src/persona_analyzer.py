@@ -1,7 +1,13 @@
 import re
-from typing import Dict, List, Any, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
+import ahocorasick
+
+from .pdf_processor import Section
+
 
 class PersonaType(Enum):
     """Enumeration of supported persona types."""
@@ -10,6 +16,32 @@ class PersonaType(Enum):
     FOOD_CONTRACTOR = "Food Contractor"
 
 
+@lru_cache(maxsize=32)
+def persona_type_for_role(persona_role: str) -> PersonaType:
+    """
+    Determine persona type from role string.
+    
+    Collections repeat the same few role strings, so results are cached.
+    
+    Args:
+        persona_role: Role string from input
+        
+    Returns:
+        PersonaType enum value
+    """
+    role_lower = persona_role.lower()
+    
+    if 'travel' in role_lower or 'planner' in role_lower:
+        return PersonaType.TRAVEL_PLANNER
+    elif 'hr' in role_lower or 'professional' in role_lower:
+        return PersonaType.HR_PROFESSIONAL
+    elif 'food' in role_lower or 'contractor' in role_lower:
+        return PersonaType.FOOD_CONTRACTOR
+    else:
+        # Default to travel planner if unknown
+        return PersonaType.TRAVEL_PLANNER
+
+
 class PersonaAnalyzer:
     """Analyzes content based on specific personas and their tasks."""
     
@@ -64,6 +96,81 @@ class PersonaAnalyzer:
                 'preparation_logistics': ['prepare', 'cook', 'timing', 'logistics']
             }
         }
+        
+        # Phrases marking a line as actionable, one alternation per persona
+        action_indicators = {
+            PersonaType.TRAVEL_PLANNER: [
+                'visit', 'go to', 'see', 'explore', 'try', 'book', 'reserve',
+                'stay at', 'eat at', 'enjoy', 'experience', 'discover'
+            ],
+            PersonaType.HR_PROFESSIONAL: [
+                'create', 'build', 'design', 'fill', 'sign', 'send', 'track',
+                'manage', 'organize', 'automate', 'enable', 'configure'
+            ],
+            PersonaType.FOOD_CONTRACTOR: [
+                'ingredients', 'instructions', 'cook', 'prepare', 'serve',
+                'recipe', 'method', 'steps', 'directions'
+            ]
+        }
+        self._actionable_res = {
+            persona_type: re.compile('|'.join(map(re.escape, indicators)))
+            for persona_type, indicators in action_indicators.items()
+        }
+        
+        # Categories only group the keyword lists and never affect scoring,
+        # so each persona's keywords are flattened once up front
+        self._flat_keywords = {
+            persona_type: self._flatten_keywords(persona_type)
+            for persona_type in PersonaType
+        }
+        
+        # One automaton per persona finds all of its keywords in a single pass
+        self._keyword_automata = {
+            persona_type: self._build_keyword_automaton(flat_keywords)
+            for persona_type, flat_keywords in self._flat_keywords.items()
+        }
+    
+    def _flatten_keywords(self, persona_type: PersonaType) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Flatten a persona's categorised persona and task keywords.
+        
+        Args:
+            persona_type: Type of persona
+            
+        Returns:
+            Tuple of (keyword, persona_hits, task_hits), the number of persona
+            and task categories listing each keyword
+        """
+        entries = {}
+        for keywords in self.persona_keywords.get(persona_type, {}).values():
+            for keyword in keywords:
+                persona_hits, task_hits = entries.get(keyword, (0, 0))
+                entries[keyword] = (persona_hits + 1, task_hits)
+        for keywords in self.task_keywords.get(persona_type, {}).values():
+            for keyword in keywords:
+                persona_hits, task_hits = entries.get(keyword, (0, 0))
+                entries[keyword] = (persona_hits, task_hits + 1)
+        
+        return tuple(
+            (keyword, persona_hits, task_hits)
+            for keyword, (persona_hits, task_hits) in entries.items()
+        )
+    
+    def _build_keyword_automaton(self, flat_keywords: Tuple[Tuple[str, int, int], ...]) -> ahocorasick.Automaton:
+        """
+        Build an Aho-Corasick automaton over flattened keywords.
+        
+        Args:
+            flat_keywords: Tuple of (keyword, persona_hits, task_hits)
+            
+        Returns:
+            Automaton mapping each keyword to its (keyword, persona_hits, task_hits)
+        """
+        automaton = ahocorasick.Automaton()
+        for entry in flat_keywords:
+            automaton.add_word(entry[0], entry)
+        automaton.make_automaton()
+        return automaton
     
     def get_persona_type(self, persona_role: str) -> PersonaType:
         """
@@ -75,20 +182,23 @@ class PersonaAnalyzer:
         Returns:
             PersonaType enum value
         """
-        role_lower = persona_role.lower()
+        return persona_type_for_role(persona_role)
+    
+    def get_task_terms(self, task_description: str) -> Tuple[str, ...]:
+        """
+        Split a task description into the terms matched against content.
         
-        if 'travel' in role_lower or 'planner' in role_lower:
-            return PersonaType.TRAVEL_PLANNER
-        elif 'hr' in role_lower or 'professional' in role_lower:
-            return PersonaType.HR_PROFESSIONAL
-        elif 'food' in role_lower or 'contractor' in role_lower:
-            return PersonaType.FOOD_CONTRACTOR
-        else:
-            # Default to travel planner if unknown
-            return PersonaType.TRAVEL_PLANNER
+        Args:
+            task_description: Description of the task
+            
+        Returns:
+            Tuple of lowercased task words longer than three characters
+        """
+        return tuple(term for term in task_description.lower().split() if len(term) > 3)
     
     def analyze_content_relevance(self, text: str, persona_type: PersonaType, 
-                                task_description: str) -> Tuple[float, List[str]]:
+                                task_description: str,
+                                task_terms: Optional[Tuple[str, ...]] = None) -> Tuple[float, List[str]]:
         """
         Analyze content relevance for a specific persona and task.
         
@@ -96,46 +206,131 @@ class PersonaAnalyzer:
             text: Text content to analyze
             persona_type: Type of persona
             task_description: Description of the task
+            task_terms: Result of get_task_terms(task_description); pass it
+                when scoring many texts against the same task
             
         Returns:
-            Tuple of (relevance_score, relevant_keywords)
+            Tuple of (relevance_score, relevant_keywords). A text that
+            reaches the 1.0 cap reports only the keywords found up to it.
+        """
+        if task_terms is None:
+            task_terms = self.get_task_terms(task_description)
+        scores, found = self._score_texts([text], persona_type, task_terms)
+        return scores[0], list(found[0])
+    
+    def score_texts(self, texts: List[str], persona_type: PersonaType,
+                    task_terms: Tuple[str, ...]) -> List[float]:
         """
-        text_lower = text.lower()
-        task_lower = task_description.lower()
+        Score many texts at once, as analyze_content_relevance scores each.
         
-        # Get keywords for this persona
-        persona_keywords = self.persona_keywords.get(persona_type, {})
-        task_keywords = self.task_keywords.get(persona_type, {})
+        Args:
+            texts: Texts to score
+            persona_type: Type of persona
+            task_terms: Result of get_task_terms() for the task
+            
+        Returns:
+            Relevance scores, in the order of texts
+        """
+        return self._score_texts(texts, persona_type, task_terms)[0]
+    
+    def _score_texts(self, texts: List[str], persona_type: PersonaType,
+                     task_terms: Tuple[str, ...]) -> Tuple[List[float], List[set]]:
+        """
+        Score texts and collect the keywords and task terms found in each.
         
-        # Calculate relevance score
-        relevance_score = 0.0
-        relevant_keywords = []
+        The texts are lowercased and joined with NUL separators, which no
+        keyword or task term contains, so a single automaton pass finds the
+        matches of every text and each match is mapped back by its offset.
         
-        # Check persona-specific keywords
-        for category, keywords in persona_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    relevance_score += 0.1
-                    relevant_keywords.append(keyword)
+        Args:
+            texts: Texts to score
+            persona_type: Type of persona
+            task_terms: Result of get_task_terms() for the task
+            
+        Returns:
+            Tuple of (relevance scores, sets of keywords and task terms
+            found), both in the order of texts. Matching stops for a text
+            once its score reaches the 1.0 cap, so a capped text's set holds
+            only what was found up to that point.
+        """
+        starts = []
+        offset = 0
+        lowered = []
+        for text in texts:
+            text_lower = text.lower()
+            starts.append(offset)
+            lowered.append(text_lower)
+            offset += len(text_lower) + 1
+        blob = '\x00'.join(lowered)
         
-        # Check task-specific keywords
-        for category, keywords in task_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    relevance_score += 0.2
-                    relevant_keywords.append(keyword)
+        persona_matches = [0] * len(texts)
+        task_matches = [0] * len(texts)
+        term_matches = [0] * len(texts)
+        found_keywords = [set() for _ in texts]
+        found_terms = [set() for _ in texts]
+        # Weights are positive, so once a text's score reaches the 1.0 cap
+        # its remaining matches are skipped
+        capped = [False] * len(texts)
+        
+        # A keyword scores once per category listing it, however often it
+        # occurs in a text
+        automaton = self._keyword_automata.get(persona_type)
+        if automaton is not None and texts:
+            for end_idx, (keyword, persona_hits, task_hits) in automaton.iter(blob):
+                index = bisect_right(starts, end_idx) - 1
+                if capped[index] or keyword in found_keywords[index]:
+                    continue
+                found_keywords[index].add(keyword)
+                persona_matches[index] += persona_hits
+                task_matches[index] += task_hits
+                if self._relevance_score(persona_matches[index], task_matches[index], 0) >= 1.0:
+                    capped[index] = True
         
-        # Check for task-specific terms in the text
-        task_terms = task_lower.split()
+        # Task terms get their own automaton; repeated words in the task
+        # description score once per repetition
+        term_counts = {}
         for term in task_terms:
-            if len(term) > 3 and term in text_lower:
-                relevance_score += 0.15
-                relevant_keywords.append(term)
+            term_counts[term] = term_counts.get(term, 0) + 1
+        if term_counts and not all(capped):
+            term_automaton = ahocorasick.Automaton()
+            for term, count in term_counts.items():
+                term_automaton.add_word(term, (term, count))
+            term_automaton.make_automaton()
+            for end_idx, (term, count) in term_automaton.iter(blob):
+                index = bisect_right(starts, end_idx) - 1
+                if capped[index] or term in found_terms[index]:
+                    continue
+                found_terms[index].add(term)
+                term_matches[index] += count
+                if self._relevance_score(persona_matches[index], task_matches[index],
+                                         term_matches[index]) >= 1.0:
+                    capped[index] = True
         
-        # Normalize score
-        relevance_score = min(relevance_score, 1.0)
+        scores = [
+            self._relevance_score(*matches)
+            for matches in zip(persona_matches, task_matches, term_matches)
+        ]
+        return scores, [keywords | terms for keywords, terms in zip(found_keywords, found_terms)]
+    
+    def _relevance_score(self, persona_matches: int, task_matches: int,
+                         term_matches: int) -> float:
+        """
+        Combine keyword match counts into a relevance score capped at 1.0.
+        
+        Weights are added one match at a time, persona before task before
+        task terms, so scores (and ranking ties) do not depend on the order
+        matches were found in.
+        """
+        relevance_score = 0.0
+        for _ in range(persona_matches):
+            relevance_score += 0.1
+        for _ in range(task_matches):
+            relevance_score += 0.2
+        for _ in range(term_matches):
+            relevance_score += 0.15
         
-        return relevance_score, list(set(relevant_keywords))
+        # Normalize score
+        return min(relevance_score, 1.0)
     
     def extract_actionable_content(self, text: str, persona_type: PersonaType) -> List[str]:
         """
@@ -149,57 +344,31 @@ class PersonaAnalyzer:
             List of actionable content snippets
         """
         actionable_content = []
-        lines = text.split('\n')
+        if persona_type not in self._actionable_res:
+            return actionable_content
         
-        for line in lines:
+        for line in text.splitlines():
             line = line.strip()
             if not line:
                 continue
             
             # Check for actionable patterns based on persona
-            if persona_type == PersonaType.TRAVEL_PLANNER:
-                if self._is_travel_actionable(line):
-                    actionable_content.append(line)
-            elif persona_type == PersonaType.HR_PROFESSIONAL:
-                if self._is_hr_actionable(line):
-                    actionable_content.append(line)
-            elif persona_type == PersonaType.FOOD_CONTRACTOR:
-                if self._is_food_actionable(line):
-                    actionable_content.append(line)
+            if self._is_actionable(line, persona_type):
+                actionable_content.append(line)
         
         return actionable_content
     
-    def _is_travel_actionable(self, line: str) -> bool:
-        """Check if line contains actionable travel information."""
-        action_indicators = [
-            'visit', 'go to', 'see', 'explore', 'try', 'book', 'reserve',
-            'stay at', 'eat at', 'enjoy', 'experience', 'discover'
-        ]
-        return any(indicator in line.lower() for indicator in action_indicators)
+    def _is_actionable(self, line: str, persona_type: PersonaType) -> bool:
+        """Check if line contains actionable information for the persona."""
+        return self._actionable_res[persona_type].search(line.lower()) is not None
     
-    def _is_hr_actionable(self, line: str) -> bool:
-        """Check if line contains actionable HR information."""
-        action_indicators = [
-            'create', 'build', 'design', 'fill', 'sign', 'send', 'track',
-            'manage', 'organize', 'automate', 'enable', 'configure'
-        ]
-        return any(indicator in line.lower() for indicator in action_indicators)
-    
-    def _is_food_actionable(self, line: str) -> bool:
-        """Check if line contains actionable food information."""
-        action_indicators = [
-            'ingredients', 'instructions', 'cook', 'prepare', 'serve',
-            'recipe', 'method', 'steps', 'directions'
-        ]
-        return any(indicator in line.lower() for indicator in action_indicators)
-    
-    def rank_sections_by_importance(self, sections: List[Dict], persona_type: PersonaType,
-                                  task_description: str) -> List[Tuple[Dict, float]]:
+    def rank_sections_by_importance(self, sections: List[Section], persona_type: PersonaType,
+                                  task_description: str) -> List[Tuple[Section, float]]:
         """
         Rank sections by importance for the specific persona and task.
         
         Args:
-            sections: List of section dictionaries
+            sections: List of sections
             persona_type: Type of persona
             task_description: Description of the task
             
@@ -207,16 +376,18 @@ class PersonaAnalyzer:
             List of tuples (section, importance_score) sorted by importance
         """
         ranked_sections = []
+        task_terms = self.get_task_terms(task_description)
         
+        # Score every title and content in one pass, interleaved
+        texts = []
         for section in sections:
-            title = section.get('title', '')
-            content = section.get('content', '')
-            
-            # Analyze title relevance
-            title_relevance, _ = self.analyze_content_relevance(title, persona_type, task_description)
-            
-            # Analyze content relevance
-            content_relevance, _ = self.analyze_content_relevance(content, persona_type, task_description)
+            texts.append(section.title)
+            texts.append(section.content)
+        scores = self.score_texts(texts, persona_type, task_terms)
+        
+        for i, section in enumerate(sections):
+            title_relevance = scores[2 * i]
+            content_relevance = scores[2 * i + 1]
             
             # Calculate overall importance score
             importance_score = (title_relevance * 0.4) + (content_relevance * 0.6)
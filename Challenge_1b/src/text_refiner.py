@@ -1,7 +1,161 @@
+import heapq
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple
 from collections import Counter
 
+import ahocorasick
+
+try:
+    import re2
+except ImportError:  # fall back to re (see _compile_extraction_pattern)
+    re2 = None
+
+
+# Patterns shared by every content type, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+# Sentences: the non-empty runs between sentence punctuation, found lazily
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+# A character that makes a sentence non-empty once stripped
+_SENTENCE_CHAR_RE = re.compile(r'[^.!?\s]')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_BULLET_RE = re.compile(r'^\s*[•\-\*]\s*', re.MULTILINE)
+_URL_RE = re.compile(r'https?://\S+')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EXCESS_PUNCTUATION_RE = re.compile(r'[.!?]{3,}')
+
+# re's \s, \d and \b are Unicode-aware but RE2's are ASCII-only, so the
+# RE2 versions of the patterns spell out the Unicode classes
+_RE2_WHITESPACE = r'\t\n\x0b\x0c\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+_RE2_ESCAPES = {
+    r'\d': r'\p{Nd}',
+    # RE2 has no lookbehind; consuming the preceding non-word character
+    # is equivalent for a \b that precedes a word character and a group
+    r'\b': r'(?:^|[^\pL\pN_])',
+}
+# re's IGNORECASE also matches i and I against the Turkish dotted capital
+# and dotless small i; RE2's case folding does not, so they are added
+_RE2_EXTRA_I_FOLDS = {'\u0130': r'\x{130}', '\u0131': r'\x{131}'}
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    """
+    Translate one of this module's re patterns to equivalent RE2 syntax,
+    for case-insensitive matching.
+    """
+    parts = []
+    class_start = None
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if escape == r'\s':
+                parts.append(_RE2_WHITESPACE if class_start is not None else f'[{_RE2_WHITESPACE}]')
+            else:
+                parts.append(_RE2_ESCAPES.get(escape, escape))
+            i += 2
+            continue
+        if class_start is None and char == '[':
+            class_start = i
+        elif class_start is not None and char == ']':
+            # List the extra i-folds re's version of the class matches
+            # (for a negated class, the ones it rejects)
+            source = pattern[class_start:i + 1]
+            negated = source.startswith('[^')
+            parts.extend(
+                escape for fold, escape in _RE2_EXTRA_I_FOLDS.items()
+                if bool(re.match(source, fold, re.IGNORECASE)) != negated
+            )
+            class_start = None
+        elif class_start is None and char in 'iI':
+            char = '[iI' + ''.join(_RE2_EXTRA_I_FOLDS.values()) + ']'
+        parts.append(char)
+        i += 1
+    return ''.join(parts)
+
+
+def _compile_extraction_pattern(pattern: str):
+    """
+    Compile a case-insensitive extraction pattern.
+    
+    Uses google-re2 when available: its automaton matches in time linear in
+    the text, whereas ([^.!?]+)-style captures can backtrack badly in re.
+    Falls back to re, which accepts the same patterns.
+    """
+    if re2 is not None:
+        return re2.compile('(?i)' + _to_re2_syntax(pattern))
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_DEFINITION_RE = _compile_extraction_pattern(r'\b(?:is|are|refers to|means)\s+([^.!?]+)')
+_EXAMPLE_RE = _compile_extraction_pattern(r'\b(?:example|for instance|such as)\s+([^.!?]+)')
+
+# Page numbers, removed before anything else
+_PAGE_NUMBER_RE = re.compile(r'\b(?:Page|P)\s*\d+\b')
+
+# Common PDF artifacts. They are removed one pattern after another, in
+# this order: where two overlap ("Adobe PDF Document"), the earlier
+# pattern wins, and removing one can reveal another.
+_ARTIFACT_PATTERNS = [
+    r'Adobe\s+Reader',
+    r'PDF\s+Document',
+    r'Page\s+\d+\s+of\s+\d+',
+    r'©\s*\d{4}',
+    r'All\s+rights\s+reserved',
+    r'Confidential',
+    r'Draft',
+    r'Adobe\s+Acrobat',
+    r'Learn\s+Acrobat',
+    r'Adobe\s+PDF'
+]
+_ARTIFACT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _ARTIFACT_PATTERNS)
+# Any artifact at all. Most texts have none and skip the passes above; a
+# text without a match is left unchanged by all of them. The leading
+# lookahead rejects most positions with a single set test before any
+# branch is tried.
+_ANY_ARTIFACT_RE = re.compile(
+    r'(?=[pacdl©])(?:' + '|'.join(_ARTIFACT_PATTERNS) + ')', re.IGNORECASE
+)
+
+
+def _build_sentence_keyword_automaton() -> ahocorasick.Automaton:
+    """Map each sentence-scoring keyword to (keyword, weight)."""
+    weighted_words = [
+        # Important keywords
+        (['important', 'key', 'essential', 'main', 'primary', 'best', 'top'], 3),
+        # Action words
+        (['create', 'build', 'make', 'do', 'use', 'try', 'visit', 'explore'], 2),
+        # Specific terms
+        (['recipe', 'ingredient', 'form', 'workflow', 'destination', 'activity'], 2)
+    ]
+    automaton = ahocorasick.Automaton()
+    for words, weight in weighted_words:
+        for word in words:
+            automaton.add_word(word, (word, weight))
+    automaton.make_automaton()
+    return automaton
+
+
+# Keywords that raise a sentence's summary score, found in one pass
+_SENTENCE_KEYWORDS = _build_sentence_keyword_automaton()
+
+# Words marking a sentence as worth quoting when a summary has no structured info
+_TRAVEL_SUMMARY_WORDS_RE = re.compile('|'.join(map(re.escape, [
+    'visit', 'see', 'explore', 'enjoy', 'experience', 'discover', 'try', 'go to'
+])))
+_HR_SUMMARY_WORDS_RE = re.compile('|'.join(map(re.escape, [
+    'create', 'build', 'design', 'fill', 'sign', 'send', 'track', 'manage', 'organize'
+])))
+_FOOD_SUMMARY_WORDS_RE = re.compile('|'.join(map(re.escape, [
+    'ingredient', 'recipe', 'cook', 'prepare', 'serve', 'dish', 'meal', 'food'
+])))
+
+# Words marking a sentence as a key point in general content
+_KEY_POINT_WORDS_RE = re.compile('|'.join([
+    'important', 'key', 'essential', 'critical', 'main', 'primary'
+]))
+
 
 class TextRefiner:
     """Refines and extracts key information from PDF text content."""
@@ -13,7 +167,7 @@ class TextRefiner:
         # Common patterns for different content types
         self.patterns = {
             'travel': {
-                'destinations': r'\b(?:visit|go to|see|explore)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+                'destinations': r'\b(?:visit|go\s+to|see|explore)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
                 'activities': r'\b(?:enjoy|experience|try|discover)\s+([^.!?]+)',
                 'locations': r'\b(?:in|at|near)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
                 'tips': r'\b(?:tip|advice|recommendation|suggestion)\s*:?\s*([^.!?]+)'
@@ -25,12 +179,35 @@ class TextRefiner:
                 'workflows': r'\b(?:workflow|process|automation)\s*:?\s*([^.!?]+)'
             },
             'food': {
-                'ingredients': r'\b(?:ingredients?|you will need)\s*:?\s*([^.!?]+)',
+                'ingredients': r'\b(?:ingredients?|you\s+will\s+need)\s*:?\s*([^.!?]+)',
                 'instructions': r'\b(?:instructions?|directions?|method)\s*:?\s*([^.!?]+)',
                 'recipes': r'\b(?:recipe|dish|meal)\s*:?\s*([^.!?]+)',
                 'preparation': r'\b(?:prepare|cook|make|serve)\s+([^.!?]+)'
             }
         }
+        
+        # Compiled once here rather than looked up in re's cache on every call
+        self._compiled_patterns = {
+            content_type: {
+                name: _compile_extraction_pattern(pattern)
+                for name, pattern in patterns.items()
+            }
+            for content_type, patterns in self.patterns.items()
+        }
+        
+        # Actionable summary builder for each content type
+        self._summary_builders = {
+            'travel': self._create_travel_summary,
+            'hr': self._create_hr_summary,
+            'food': self._create_food_summary
+        }
+        
+        # Per-instance memo caches: the same page text is often refined,
+        # mined or summarised more than once. Results assume the settings
+        # above are not changed after construction.
+        self._refine_cached = lru_cache(maxsize=4096)(self._refine_text_content)
+        self._key_information_cached = lru_cache(maxsize=4096)(self._extract_key_information)
+        self._summarize_cached = lru_cache(maxsize=4096)(self._summarize_content)
     
     def refine_text_content(self, text: str, content_type: str = 'general') -> str:
         """
@@ -43,93 +220,88 @@ class TextRefiner:
         Returns:
             Refined text content
         """
+        return self._refine_cached(text, content_type)
+    
+    def _refine_text_content(self, text: str, content_type: str) -> str:
+        """Uncached refine_text_content."""
         if not text:
             return ""
         
         # Clean up common PDF artifacts
         refined = self._clean_pdf_artifacts(text)
         
-        # Remove excessive whitespace
-        refined = re.sub(r'\s+', ' ', refined)
-        
         # Remove common noise patterns
         refined = self._remove_noise_patterns(refined)
         
-        # Extract relevant content based on type
-        if content_type in self.patterns:
+        # Extract relevant content based on type. Whitespace is collapsed
+        # once, after every removal has been made; extraction collapses
+        # only the text it returns.
+        if content_type in self._compiled_patterns:
             refined = self._extract_relevant_content(refined, content_type)
+        else:
+            refined = _WHITESPACE_RE.sub(' ', refined)
         
         return refined.strip()
     
     def _clean_pdf_artifacts(self, text: str) -> str:
         """Remove common PDF extraction artifacts."""
         # Remove page numbers and headers
-        text = re.sub(r'\b(?:Page|P)\s*\d+\b', '', text)
+        text = _PAGE_NUMBER_RE.sub('', text)
         
         # Remove excessive line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         # Remove common PDF artifacts
-        artifacts = [
-            r'Adobe\s+Reader',
-            r'PDF\s+Document',
-            r'Page\s+\d+\s+of\s+\d+',
-            r'©\s*\d{4}',
-            r'All\s+rights\s+reserved',
-            r'Confidential',
-            r'Draft',
-            r'Adobe\s+Acrobat',
-            r'Learn\s+Acrobat',
-            r'Adobe\s+PDF'
-        ]
-        
-        for pattern in artifacts:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        if _ANY_ARTIFACT_RE.search(text):
+            for pattern in _ARTIFACT_RES:
+                text = pattern.sub('', text)
         
         # Clean up bullet points and formatting
-        text = re.sub(r'^\s*[•\-\*]\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'\s+', ' ', text)
+        text = _BULLET_RE.sub('', text)
         
         return text
     
     def _remove_noise_patterns(self, text: str) -> str:
         """Remove noise patterns from text."""
         # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
+        text = _URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text)
+        text = _EMAIL_RE.sub('', text)
         
         # Remove excessive punctuation
-        text = re.sub(r'[.!?]{3,}', '.', text)
-        
-        # Remove excessive spaces
-        text = re.sub(r'\s{2,}', ' ', text)
+        text = _EXCESS_PUNCTUATION_RE.sub('.', text)
         
         return text
     
     def _extract_relevant_content(self, text: str, content_type: str) -> str:
-        """Extract content relevant to the specific type."""
-        patterns = self.patterns.get(content_type, {})
-        relevant_sentences = []
+        """
+        Extract content relevant to the specific type, with whitespace
+        collapsed.
         
-        sentences = re.split(r'[.!?]+', text)
+        The patterns match the same across any run of whitespace, so they
+        are searched in the uncollapsed text and only the sentences kept
+        are collapsed.
+        """
+        patterns = tuple(self._compiled_patterns.get(content_type, {}).values())
+        relevant_sentences = []
         
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            # Collapsing can only shorten a sentence
             if len(sentence) < self.min_content_length:
                 continue
             
             # Check if sentence contains relevant patterns
-            for pattern_name, pattern in patterns.items():
-                if re.search(pattern, sentence, re.IGNORECASE):
+            if any(pattern.search(sentence) for pattern in patterns):
+                sentence = _WHITESPACE_RE.sub(' ', sentence)
+                if len(sentence) >= self.min_content_length:
                     relevant_sentences.append(sentence)
-                    break
         
         if relevant_sentences:
             return '. '.join(relevant_sentences) + '.'
         else:
-            return text
+            return _WHITESPACE_RE.sub(' ', text)
     
     def extract_key_information(self, text: str, content_type: str = 'general') -> Dict[str, List[str]]:
         """
@@ -142,99 +314,20 @@ class TextRefiner:
         Returns:
             Dictionary with extracted information categories
         """
-        extracted_info = {}
-        
-        if content_type == 'travel':
-            extracted_info = self._extract_travel_info(text)
-        elif content_type == 'hr':
-            extracted_info = self._extract_hr_info(text)
-        elif content_type == 'food':
-            extracted_info = self._extract_food_info(text)
-        else:
-            extracted_info = self._extract_general_info(text)
-        
-        return extracted_info
-    
-    def _extract_travel_info(self, text: str) -> Dict[str, List[str]]:
-        """Extract travel-specific information."""
-        info = {
-            'destinations': [],
-            'activities': [],
-            'tips': [],
-            'locations': []
-        }
-        
-        # Extract destinations
-        destinations = re.findall(r'\b(?:visit|go to|see|explore)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text, re.IGNORECASE)
-        info['destinations'].extend(destinations)
-        
-        # Extract activities
-        activities = re.findall(r'\b(?:enjoy|experience|try|discover)\s+([^.!?]+)', text, re.IGNORECASE)
-        info['activities'].extend(activities)
-        
-        # Extract tips
-        tips = re.findall(r'\b(?:tip|advice|recommendation|suggestion)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['tips'].extend(tips)
-        
-        # Extract locations
-        locations = re.findall(r'\b(?:in|at|near)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text, re.IGNORECASE)
-        info['locations'].extend(locations)
-        
-        return info
-    
-    def _extract_hr_info(self, text: str) -> Dict[str, List[str]]:
-        """Extract HR-specific information."""
-        info = {
-            'steps': [],
-            'features': [],
-            'instructions': [],
-            'workflows': []
-        }
-        
-        # Extract steps
-        steps = re.findall(r'\b(?:step|procedure|process)\s+\d+[:\s]*([^.!?]+)', text, re.IGNORECASE)
-        info['steps'].extend(steps)
-        
-        # Extract features
-        features = re.findall(r'\b(?:feature|function|tool)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['features'].extend(features)
-        
-        # Extract instructions
-        instructions = re.findall(r'\b(?:click|select|choose|enable)\s+([^.!?]+)', text, re.IGNORECASE)
-        info['instructions'].extend(instructions)
-        
-        # Extract workflows
-        workflows = re.findall(r'\b(?:workflow|process|automation)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['workflows'].extend(workflows)
-        
-        return info
+        # Copy the lists so callers cannot modify the cached result
+        cached = self._key_information_cached(text, content_type)
+        return {category: list(values) for category, values in cached.items()}
     
-    def _extract_food_info(self, text: str) -> Dict[str, List[str]]:
-        """Extract food-specific information."""
-        info = {
-            'ingredients': [],
-            'instructions': [],
-            'recipes': [],
-            'preparation': []
+    def _extract_key_information(self, text: str, content_type: str) -> Dict[str, List[str]]:
+        """Uncached extract_key_information."""
+        patterns = self._compiled_patterns.get(content_type)
+        if patterns is None:
+            return self._extract_general_info(text)
+        # Repeated matches are kept once, in order of first appearance
+        return {
+            name: list(dict.fromkeys(pattern.findall(text)))
+            for name, pattern in patterns.items()
         }
-        
-        # Extract ingredients
-        ingredients = re.findall(r'\b(?:ingredients?|you will need)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['ingredients'].extend(ingredients)
-        
-        # Extract instructions
-        instructions = re.findall(r'\b(?:instructions?|directions?|method)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['instructions'].extend(instructions)
-        
-        # Extract recipes
-        recipes = re.findall(r'\b(?:recipe|dish|meal)\s*:?\s*([^.!?]+)', text, re.IGNORECASE)
-        info['recipes'].extend(recipes)
-        
-        # Extract preparation steps
-        preparation = re.findall(r'\b(?:prepare|cook|make|serve)\s+([^.!?]+)', text, re.IGNORECASE)
-        info['preparation'].extend(preparation)
-        
-        return info
     
     def _extract_general_info(self, text: str) -> Dict[str, List[str]]:
         """Extract general information from text."""
@@ -244,21 +337,19 @@ class TextRefiner:
             'examples': []
         }
         
-        # Extract key points (sentences with important keywords)
-        key_words = ['important', 'key', 'essential', 'critical', 'main', 'primary']
-        sentences = re.split(r'[.!?]+', text)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(word in sentence.lower() for word in key_words):
+        # Extract key points (sentences with important keywords); each
+        # sentence is lowered once and scanned once
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            if _KEY_POINT_WORDS_RE.search(sentence.lower()):
                 info['key_points'].append(sentence)
         
         # Extract definitions
-        definitions = re.findall(r'\b(?:is|are|refers to|means)\s+([^.!?]+)', text, re.IGNORECASE)
+        definitions = _DEFINITION_RE.findall(text)
         info['definitions'].extend(definitions)
         
         # Extract examples
-        examples = re.findall(r'\b(?:example|for instance|such as)\s+([^.!?]+)', text, re.IGNORECASE)
+        examples = _EXAMPLE_RE.findall(text)
         info['examples'].extend(examples)
         
         return info
@@ -274,41 +365,52 @@ class TextRefiner:
         Returns:
             Summarized text
         """
-        if not text:
-            return ""
-        
         if max_length is None:
             max_length = self.max_summary_length
+        return self._summarize_cached(text, max_length)
+    
+    def _summarize_content(self, text: str, max_length: int) -> str:
+        """Uncached summarize_content."""
+        if not text:
+            return ""
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
+        # Text without a single sentence summarises to nothing
+        if not _SENTENCE_CHAR_RE.search(text):
             return ""
         
         # If text is already short enough, return as is
         if len(text) <= max_length:
             return text
         
+        # Split into sentences
+        stripped = (match.group().strip() for match in _SENTENCE_RE.finditer(text))
+        sentences = [sentence for sentence in stripped if sentence]
+        
         # Select the most important sentences
         important_sentences = self._select_important_sentences(sentences)
         
-        # Combine sentences until we reach the max length
-        summary = ""
+        # Combine sentences until we reach the max length. Each one adds
+        # its own length plus a ". " separator; only the length is tracked
+        # and the summary is joined once at the end.
+        parts = []
+        total = 0
         for sentence in important_sentences:
-            if len(summary + sentence) <= max_length:
-                summary += sentence + ". "
+            if total + len(sentence) <= max_length:
+                parts.append(sentence)
+                total += len(sentence) + 2
             else:
                 break
         
-        return summary.strip()
+        return '. '.join(parts) + '.' if parts else ""
     
     def _select_important_sentences(self, sentences: List[str]) -> List[str]:
         """Select the most important sentences based on content analysis."""
         if not sentences:
             return []
         
+        # Score each distinct sentence once, so repeats cannot fill the summary
+        sentences = list(dict.fromkeys(sentences))
+        
         # Score sentences based on various factors
         scored_sentences = []
         
@@ -322,29 +424,20 @@ class TextRefiner:
             elif 10 <= length <= 150:
                 score += 1
             
-            # Score based on keywords
-            important_words = ['important', 'key', 'essential', 'main', 'primary', 'best', 'top']
-            for word in important_words:
-                if word in sentence.lower():
-                    score += 3
-            
-            # Score based on action words
-            action_words = ['create', 'build', 'make', 'do', 'use', 'try', 'visit', 'explore']
-            for word in action_words:
-                if word in sentence.lower():
-                    score += 2
-            
-            # Score based on specific terms
-            specific_terms = ['recipe', 'ingredient', 'form', 'workflow', 'destination', 'activity']
-            for term in specific_terms:
-                if term in sentence.lower():
-                    score += 2
+            # Score based on important keywords, action words and specific
+            # terms; each word counts once however often it occurs
+            found = set()
+            for _, (word, weight) in _SENTENCE_KEYWORDS.iter(sentence.lower()):
+                if word not in found:
+                    found.add(word)
+                    score += weight
             
             scored_sentences.append((sentence, score))
         
-        # Sort by score and return top sentences
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        return [sentence for sentence, score in scored_sentences[:5]]
+        # Return the top sentences; nlargest keeps ties in sentence order
+        # as the full sort did, without sorting the rest
+        top_sentences = heapq.nlargest(5, scored_sentences, key=lambda x: x[1])
+        return [sentence for sentence, score in top_sentences]
     
     def create_actionable_summary(self, text: str, content_type: str) -> str:
         """
@@ -357,19 +450,15 @@ class TextRefiner:
         Returns:
             Actionable summary
         """
-        if content_type == 'travel':
-            return self._create_travel_summary(text)
-        elif content_type == 'hr':
-            return self._create_hr_summary(text)
-        elif content_type == 'food':
-            return self._create_food_summary(text)
-        else:
+        create_summary = self._summary_builders.get(content_type)
+        if create_summary is None:
             return self.summarize_content(text)
+        return create_summary(text)
     
     def _create_travel_summary(self, text: str) -> str:
         """Create travel-specific actionable summary."""
         # Extract key travel information
-        info = self._extract_travel_info(text)
+        info = self._key_information_cached(text, 'travel')
         
         summary_parts = []
         
@@ -386,17 +475,7 @@ class TextRefiner:
         
         # If no structured info found, create a general summary
         if not summary_parts:
-            sentences = re.split(r'[.!?]+', text)
-            relevant_sentences = []
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if len(sentence) > 20 and any(word in sentence.lower() for word in 
-                    ['visit', 'see', 'explore', 'enjoy', 'experience', 'discover', 'try', 'go to']):
-                    relevant_sentences.append(sentence)
-                    if len(relevant_sentences) >= 2:
-                        break
-            
+            relevant_sentences = self._first_matching_sentences(text, _TRAVEL_SUMMARY_WORDS_RE)
             if relevant_sentences:
                 return '. '.join(relevant_sentences) + '.'
         
@@ -405,7 +484,7 @@ class TextRefiner:
     def _create_hr_summary(self, text: str) -> str:
         """Create HR-specific actionable summary."""
         # Extract key HR information
-        info = self._extract_hr_info(text)
+        info = self._key_information_cached(text, 'hr')
         
         summary_parts = []
         
@@ -421,17 +500,7 @@ class TextRefiner:
         
         # If no structured info found, create a general summary
         if not summary_parts:
-            sentences = re.split(r'[.!?]+', text)
-            relevant_sentences = []
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if len(sentence) > 20 and any(word in sentence.lower() for word in 
-                    ['create', 'build', 'design', 'fill', 'sign', 'send', 'track', 'manage', 'organize']):
-                    relevant_sentences.append(sentence)
-                    if len(relevant_sentences) >= 2:
-                        break
-            
+            relevant_sentences = self._first_matching_sentences(text, _HR_SUMMARY_WORDS_RE)
             if relevant_sentences:
                 return '. '.join(relevant_sentences) + '.'
         
@@ -440,7 +509,7 @@ class TextRefiner:
     def _create_food_summary(self, text: str) -> str:
         """Create food-specific actionable summary."""
         # Extract key food information
-        info = self._extract_food_info(text)
+        info = self._key_information_cached(text, 'food')
         
         summary_parts = []
         
@@ -455,18 +524,22 @@ class TextRefiner:
         
         # If no structured info found, create a general summary
         if not summary_parts:
-            sentences = re.split(r'[.!?]+', text)
-            relevant_sentences = []
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if len(sentence) > 20 and any(word in sentence.lower() for word in 
-                    ['ingredient', 'recipe', 'cook', 'prepare', 'serve', 'dish', 'meal', 'food']):
-                    relevant_sentences.append(sentence)
-                    if len(relevant_sentences) >= 2:
-                        break
-            
+            relevant_sentences = self._first_matching_sentences(text, _FOOD_SUMMARY_WORDS_RE)
             if relevant_sentences:
                 return '. '.join(relevant_sentences) + '.'
         
-        return '. '.join(summary_parts) if summary_parts else self.summarize_content(text) 
\ No newline at end of file
+        return '. '.join(summary_parts) if summary_parts else self.summarize_content(text) 
+    
+    def _first_matching_sentences(self, text: str, words_re, count: int = 2) -> List[str]:
+        """
+        Return the first sentences longer than 20 characters whose lowered
+        text matches words_re, stopping as soon as count are found.
+        """
+        relevant_sentences = []
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            if len(sentence) > 20 and words_re.search(sentence.lower()):
+                relevant_sentences.append(sentence)
+                if len(relevant_sentences) >= count:
+                    break
+        return relevant_sentences
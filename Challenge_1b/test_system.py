@@ -6,12 +6,32 @@ This script validates the system functionality and output quality.
 """
 
 import os
-import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+
+import orjson
+
 from src.pdf_analyzer import PDFAnalyzer
 
 
+def _load_json(path: str):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _process_one(collection_path: str) -> bool:
+    """
+    Process a collection in a worker process.
+    
+    Returns whether the output passed validation.
+    """
+    analyzer = PDFAnalyzer()
+    output_data = analyzer.analyze_collection(collection_path)
+    return analyzer.validate_output(output_data)
+
+
 def test_system():
     """Run comprehensive system tests."""
     print("=" * 60)
@@ -42,8 +62,7 @@ def test_system():
         input_file = os.path.join(collection, 'challenge1b_input.json')
         if os.path.exists(input_file):
             try:
-                with open(input_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(input_file)
                 
                 # Check required fields
                 required_fields = ['challenge_info', 'documents', 'persona', 'job_to_be_done']
@@ -77,35 +96,44 @@ def test_system():
     print("Test 4: Collection Processing")
     print("-" * 30)
     
-    for collection in collections:
-        collection_path = os.path.join('.', collection)
-        if os.path.exists(collection_path):
+    # Collections are independent, so each is analysed in its own worker
+    # process; results are reported in collection order
+    with ProcessPoolExecutor(max_workers=len(collections)) as executor:
+        futures = {}
+        for collection in collections:
+            collection_path = os.path.join('.', collection)
+            if os.path.exists(collection_path):
+                futures[collection] = executor.submit(_process_one, collection_path)
+        
+        for collection in collections:
+            if collection not in futures:
+                print(f"❌ {collection}: Collection not found")
+                continue
             try:
                 print(f"Processing {collection}...")
-                output_data = analyzer.analyze_collection(collection_path)
                 
                 # Validate output
-                if analyzer.validate_output(output_data):
+                if futures[collection].result():
                     print(f"✅ {collection}: Processed and validated successfully")
                 else:
                     print(f"❌ {collection}: Processing failed validation")
                     
             except Exception as e:
                 print(f"❌ {collection}: Processing error - {str(e)}")
-        else:
-            print(f"❌ {collection}: Collection not found")
     print()
     
     # Test 5: Output file validation
     print("Test 5: Output File Validation")
     print("-" * 30)
     
+    # Each output file is parsed once here and reused by Test 6
+    outputs = {}
     for collection in collections:
         output_file = os.path.join(collection, 'challenge1b_output.json')
         if os.path.exists(output_file):
             try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    output_data = json.load(f)
+                output_data = _load_json(output_file)
+                outputs[collection] = output_data
                 
                 # Check structure
                 if 'metadata' in output_data and 'extracted_sections' in output_data and 'subsection_analysis' in output_data:
@@ -132,11 +160,9 @@ def test_system():
     print("-" * 30)
     
     for collection in collections:
-        output_file = os.path.join(collection, 'challenge1b_output.json')
-        if os.path.exists(output_file):
+        if collection in outputs:
             try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    output_data = json.load(f)
+                output_data = outputs[collection]
                 
                 # Check metadata
                 metadata = output_data.get('metadata', {})